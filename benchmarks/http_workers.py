@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling of the HTTP server by worker count
+
+Starts `redbee_mcp.cli --http --workers N` for each N, then drives
+`tools/list` JSON-RPC requests at it from a pool of concurrent clients
+and prints requests per second. No upstream access is needed.
+
+Usage:
+  PYTHONPATH=src python benchmarks/http_workers.py
+  PYTHONPATH=src python benchmarks/http_workers.py --workers 1 2 4 8 --duration 15
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+import httpx
+
+PAYLOAD = {"jsonrpc": "2.0", "method": "tools/list", "id": "bench"}
+
+
+async def wait_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(f"{url}/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become ready")
+
+
+async def drive(url: str, concurrency: int, duration: float) -> int:
+    done = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        async def loop() -> None:
+            nonlocal done
+            while time.monotonic() < stop_at:
+                response = await client.post(url + "/", json=PAYLOAD)
+                response.raise_for_status()
+                done += 1
+
+        await asyncio.gather(*(loop() for _ in range(concurrency)))
+    return done
+
+
+def run_case(workers: int, port: int, concurrency: int, duration: float) -> float:
+    env = dict(os.environ, REDBEE_CUSTOMER="BENCH", REDBEE_BUSINESS_UNIT="BENCH")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "redbee_mcp.cli", "--http", "--port", str(port),
+         "--workers", str(workers), "--cache-path", f"/tmp/redbee-mcp-bench-{port}.db"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    try:
+        asyncio.run(wait_ready(url))
+        asyncio.run(drive(url, concurrency, 2.0))  # warm-up
+        requests = asyncio.run(drive(url, concurrency, duration))
+        return requests / duration
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))))
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"CPU cores: {cpus}")
+    print(f"{'workers':>8} {'req/s':>10} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        rps = run_case(workers, args.port, args.concurrency, args.duration)
+        baseline = baseline or rps
+        print(f"{workers:>8} {rps:>10.0f} {rps / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Memory and CPU cost of idle SSE connections
+
+Opens N idle subscribers (10k by default) on the SseHub and on a replica of
+the previous per-connection loop (tools serialized per connection, one
+sleep timer and disconnect poll per connection), then reports Python heap
+per connection and CPU time spent while the connections sit idle.
+No sockets are opened: this isolates the server-side cost of a connection.
+
+Usage:
+  PYTHONPATH=src python benchmarks/sse_hub.py
+  PYTHONPATH=src python benchmarks/sse_hub.py --connections 10000 --interval 1 --idle 10
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+import uuid
+from typing import AsyncGenerator, List
+
+from redbee_mcp.handler import McpHandler
+from redbee_mcp.sse import SseHub
+
+
+async def tools_data() -> List[dict]:
+    return [tool.model_dump() for tool in await McpHandler().list_tools()]
+
+
+async def legacy_stream(interval: float) -> AsyncGenerator[str, None]:
+    """The per-connection generator loop used before the hub"""
+    async def is_disconnected() -> bool:
+        return False
+
+    client_id = str(uuid.uuid4())
+    yield f"data: {json.dumps({'type': 'welcome', 'client_id': client_id, 'timestamp': time.time()})}\n\n"
+    yield f"data: {json.dumps({'type': 'tools', 'tools': await tools_data()})}\n\n"
+    while True:
+        if await is_disconnected():
+            break
+        yield f"data: {json.dumps({'type': 'ping', 'timestamp': time.time()})}\n\n"
+        await asyncio.sleep(interval)
+
+
+async def consume(stream: AsyncGenerator[str, None]) -> None:
+    async for _ in stream:
+        pass
+
+
+async def measure(name: str, make_stream, connections: int, idle: float) -> None:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    cpu_start = time.process_time()
+
+    tasks = [asyncio.ensure_future(consume(make_stream())) for _ in range(connections)]
+    await asyncio.sleep(0.5)  # let every connection send its opening events
+    setup_cpu = time.process_time() - cpu_start
+
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    idle_start = time.process_time()
+    await asyncio.sleep(idle)
+    idle_cpu = time.process_time() - idle_start
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    per_conn = (after - before) / connections
+    print(f"{name:>8} {per_conn / 1024:>10.2f} {(after - before) / 2**20:>10.1f} "
+          f"{setup_cpu:>10.2f} {idle_cpu / idle * 100:>10.2f}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--interval", type=float, default=1.0, help="Heartbeat interval in seconds")
+    parser.add_argument("--idle", type=float, default=10.0, help="Idle measurement window in seconds")
+    args = parser.parse_args()
+
+    print(f"{args.connections} idle connections, heartbeat every {args.interval}s")
+    print(f"{'mode':>8} {'KiB/conn':>10} {'MiB total':>10} {'setup CPU':>10} {'idle CPU%':>10}")
+
+    await measure("legacy", lambda: legacy_stream(args.interval), args.connections, args.idle)
+
+    hub = SseHub(tools_data, heartbeat_interval=args.interval)
+    await measure("hub", hub.stream, args.connections, args.idle)
+    await hub.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
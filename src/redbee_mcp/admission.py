@@ -0,0 +1,120 @@
+"""
+Admission control for tool calls
+Bounds concurrent calls and queueing time so bursts are shed quickly
+instead of piling onto the upstream and the event loop
+"""
+
+import asyncio
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code returned when a call is shed
+OVERLOADED_ERROR_CODE = -32000
+
+DEFAULT_MAX_CONCURRENT_CALLS = 32
+DEFAULT_MAX_QUEUED_CALLS = 64
+DEFAULT_MAX_QUEUE_WAIT = 2.0
+
+
+class OverloadedError(Exception):
+    """Raised when a call cannot be admitted"""
+
+    def __init__(self, message: str, retry_after: float):
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
+
+
+class AdmissionController:
+    """
+    Bounded admission queue in front of tool execution
+
+    At most max_concurrent calls run at once and at most max_queued wait for
+    a slot. A call that finds the queue full, or waits longer than max_wait,
+    fails immediately with OverloadedError and a retry-after estimate.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_CALLS,
+        max_queued: int = DEFAULT_MAX_QUEUED_CALLS,
+        max_wait: float = DEFAULT_MAX_QUEUE_WAIT
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.max_wait = max_wait
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        # Set on shutdown: new calls are refused so clients retry elsewhere
+        self.draining = False
+        # Exponentially weighted average duration of admitted calls, in seconds
+        self.average_duration = 0.5
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def retry_after(self) -> float:
+        """Estimated seconds until a slot frees up for a new caller"""
+        backlog = (self.queued + 1) / self.max_concurrent
+        return max(1.0, round(backlog * self.average_duration, 1))
+
+    def _reject(self, reason: str) -> OverloadedError:
+        self.rejected += 1
+        retry_after = self.retry_after()
+        logger.warning(f"Shedding tool call: {reason} (retry after {retry_after}s)")
+        return OverloadedError(f"Server overloaded: {reason}", retry_after)
+
+    async def acquire(self) -> None:
+        """Waits for an execution slot or raises OverloadedError"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        if self.draining:
+            raise self._reject("server is shutting down")
+
+        if self.in_flight >= self.max_concurrent:
+            if self.queued >= self.max_queued:
+                raise self._reject("admission queue full")
+            self.queued += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=self.max_wait)
+            except asyncio.TimeoutError:
+                raise self._reject(f"no slot within {self.max_wait}s")
+            finally:
+                self.queued -= 1
+        else:
+            await self._semaphore.acquire()
+
+        self.in_flight += 1
+        self.admitted += 1
+
+    def release(self, duration: float) -> None:
+        self.in_flight -= 1
+        self.average_duration = 0.9 * self.average_duration + 0.1 * duration
+        assert self._semaphore is not None
+        self._semaphore.release()
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Runs the enclosed block in an execution slot"""
+        await self.acquire()
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.release(time.monotonic() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_concurrent": self.max_concurrent,
+            "max_queued": self.max_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "draining": self.draining,
+        }
@@ -0,0 +1,206 @@
+"""
+Tool result cache for Red Bee MCP
+Backends are pluggable so several HTTP workers can share one cache
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from mcp.types import TextContent
+
+from .models import RedBeeConfig
+
+logger = logging.getLogger(__name__)
+
+# Default location of the shared cache used by multi-worker HTTP mode
+DEFAULT_SHARED_CACHE_PATH = "/tmp/redbee-mcp-cache.db"
+
+# Read-only tools whose results do not depend on the caller and can be shared
+CACHEABLE_TOOLS = {
+    "get_public_asset_details",
+    "search_content_v2",
+    "search_assets_autocomplete",
+    "get_epg_for_channel",
+    "get_episodes_for_season",
+    "get_assets_by_tag",
+    "list_assets",
+    "search_multi_v3",
+    "get_asset_collection_entries",
+    "get_asset_thumbnail",
+    "get_seasons_for_series",
+    "get_system_config",
+    "get_active_channels",
+}
+
+# Tool results starting with one of these are errors and are never cached
+ERROR_PREFIXES = ("Error", "Red Bee API Error", "Unknown tool", "❌")
+
+
+class CacheBackend:
+    """Base class for cache storage backends"""
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    async def set(self, namespace: str, key: str, value: str, ttl: float) -> None:
+        raise NotImplementedError
+
+    async def delete(self, namespace: str, key: str) -> None:
+        raise NotImplementedError
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases backend resources"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache, private to one worker"""
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._entries[(namespace, key)]
+            return None
+        self._entries.move_to_end((namespace, key))
+        return value
+
+    async def set(self, namespace: str, key: str, value: str, ttl: float) -> None:
+        self._entries[(namespace, key)] = (time.time() + ttl, value)
+        self._entries.move_to_end((namespace, key))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, namespace: str, key: str) -> None:
+        self._entries.pop((namespace, key), None)
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        if namespace is None:
+            self._entries.clear()
+            return
+        for entry_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[entry_key]
+
+
+class SqliteCacheBackend(CacheBackend):
+    """
+    SQLite-file cache shared by every process opening the same path
+    Queries run in the default executor to keep disk I/O off the event loop
+    """
+
+    def __init__(self, path: str = DEFAULT_SHARED_CACHE_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        self._conn.execute("DELETE FROM cache WHERE expires_at < ?", (time.time(),))
+
+    def _execute(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    async def _run(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._execute, sql, params)
+
+    async def get(self, namespace: str, key: str) -> Optional[str]:
+        rows = await self._run(
+            "SELECT value FROM cache WHERE namespace = ? AND key = ? AND expires_at >= ?",
+            (namespace, key, time.time())
+        )
+        return rows[0][0] if rows else None
+
+    async def set(self, namespace: str, key: str, value: str, ttl: float) -> None:
+        await self._run(
+            "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+            (namespace, key, value, time.time() + ttl)
+        )
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await self._run("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+
+    async def clear(self, namespace: Optional[str] = None) -> None:
+        if namespace is None:
+            await self._run("DELETE FROM cache")
+        else:
+            await self._run("DELETE FROM cache WHERE namespace = ?", (namespace,))
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ToolResultCache:
+    """Caches results of read-only tools for a fixed TTL"""
+
+    namespace = "tools"
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, config: RedBeeConfig) -> Optional["ToolResultCache"]:
+        """Builds the cache described by the configuration, or None when disabled"""
+        if config.cache_ttl <= 0:
+            return None
+        if config.cache_path:
+            logger.info(f"Using shared tool cache at {config.cache_path}")
+            return cls(SqliteCacheBackend(config.cache_path), config.cache_ttl)
+        return cls(MemoryCacheBackend(), config.cache_ttl)
+
+    @staticmethod
+    def make_key(name: str, arguments: Dict[str, Any]) -> str:
+        payload = json.dumps({"name": name, "arguments": arguments}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, name: str, arguments: Dict[str, Any]) -> Optional[List[TextContent]]:
+        if name not in CACHEABLE_TOOLS:
+            return None
+        try:
+            value = await self.backend.get(self.namespace, self.make_key(name, arguments))
+        except Exception as e:
+            logger.warning(f"Tool cache read failed: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return [TextContent(**item) for item in json.loads(value)]
+
+    async def set(self, name: str, arguments: Dict[str, Any], result: List[TextContent]) -> None:
+        if name not in CACHEABLE_TOOLS:
+            return
+        if any(content.text.startswith(ERROR_PREFIXES) for content in result):
+            return
+        value = json.dumps([content.model_dump() for content in result], ensure_ascii=False)
+        try:
+            await self.backend.set(self.namespace, self.make_key(name, arguments), value, self.ttl)
+        except Exception as e:
+            logger.warning(f"Tool cache write failed: {e}")
+
+    async def close(self) -> None:
+        await self.backend.close()
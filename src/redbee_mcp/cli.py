@@ -7,6 +7,7 @@ Usage:
   redbee-mcp --http                     # HTTP mode only  
   redbee-mcp --both                     # Both modes in parallel
   redbee-mcp --http --port 8001         # HTTP on custom port
+  redbee-mcp --http --workers 4         # HTTP with 4 worker processes
 """
 
 import argparse
@@ -15,7 +16,8 @@ import logging
 import os
 import signal
 import sys
-from typing import Optional
+import time
+from typing import Any, Dict, Optional
 import multiprocessing as mp
 
 # Configure logging
@@ -33,6 +35,7 @@ class RedBeeMCPCLI:
     
     def __init__(self):
         self.config = None
+        self.args: Optional[argparse.Namespace] = None
 
     def parse_args(self) -> argparse.Namespace:
         """Parse command line arguments and environment variables."""
@@ -46,6 +49,7 @@ Usage examples:
   %(prog)s --both                     # Both modes in parallel
   %(prog)s --http --port 8001         # HTTP on custom port
   %(prog)s --http --host 127.0.0.1    # HTTP on custom host
+  %(prog)s --http --workers 4         # HTTP with 4 worker processes
             """
         )
         
@@ -79,6 +83,100 @@ Usage examples:
             default=8000,
             help="Port for HTTP server (default: 8000)"
         )
+        parser.add_argument(
+            "--batch-concurrency", 
+            type=int,
+            default=int(os.getenv("REDBEE_BATCH_CONCURRENCY", "8")),
+            help="Maximum concurrent requests per JSON-RPC batch (default: 8)"
+        )
+        parser.add_argument(
+            "--workers", 
+            type=int,
+            default=int(os.getenv("REDBEE_HTTP_WORKERS", "1")),
+            help="Number of HTTP worker processes (default: 1)"
+        )
+        parser.add_argument(
+            "--compression-level", 
+            type=int,
+            default=int(os.getenv("REDBEE_COMPRESSION_LEVEL", "6")),
+            help="gzip/brotli compression level for HTTP responses, 0 disables compression (default: 6)"
+        )
+        parser.add_argument(
+            "--compression-min-size", 
+            type=int,
+            default=int(os.getenv("REDBEE_COMPRESSION_MIN_SIZE", "1024")),
+            help="Minimum response size in bytes before compressing (default: 1024)"
+        )
+        
+        # Admission control for tool calls
+        parser.add_argument(
+            "--max-concurrent-calls", 
+            type=int,
+            default=int(os.getenv("REDBEE_MAX_CONCURRENT_CALLS", "32")),
+            help="Maximum tool calls executed at once in HTTP mode (default: 32)"
+        )
+        parser.add_argument(
+            "--max-queued-calls", 
+            type=int,
+            default=int(os.getenv("REDBEE_MAX_QUEUED_CALLS", "64")),
+            help="Maximum tool calls waiting for a slot before shedding (default: 64)"
+        )
+        parser.add_argument(
+            "--max-queue-wait", 
+            type=float,
+            default=float(os.getenv("REDBEE_MAX_QUEUE_WAIT", "2.0")),
+            help="Maximum seconds a tool call waits for a slot before shedding (default: 2.0)"
+        )
+        
+        # Per-client rate limiting
+        parser.add_argument(
+            "--rate-limits", 
+            default=os.getenv("REDBEE_RATE_LIMITS", "light=20/40,standard=5/20,heavy=1/5"),
+            help="Per-client token buckets by tool cost class as class=rate/burst (calls per second), "
+                 "or 'off' (default: light=20/40,standard=5/20,heavy=1/5)"
+        )
+        parser.add_argument(
+            "--rate-limit-max-buckets", 
+            type=int,
+            default=int(os.getenv("REDBEE_RATE_LIMIT_MAX_BUCKETS", "10000")),
+            help="Maximum rate limit buckets kept in memory, idle ones are evicted first (default: 10000)"
+        )
+        
+        # Cache configuration
+        parser.add_argument(
+            "--cache-ttl", 
+            type=int,
+            default=int(os.getenv("REDBEE_CACHE_TTL", "30")),
+            help="Tool result cache TTL in seconds, 0 disables the cache (default: 30)"
+        )
+        parser.add_argument(
+            "--cache-path", 
+            default=os.getenv("REDBEE_CACHE_PATH"),
+            help="SQLite file for a cache shared between processes (default: in-memory, "
+                 "or /tmp/redbee-mcp-cache.db with --workers > 1)"
+        )
+        
+        # Upstream connection pool
+        parser.add_argument(
+            "--upstream-concurrency", 
+            type=int,
+            default=int(os.getenv("REDBEE_UPSTREAM_CONCURRENCY", "32")),
+            help="Maximum concurrent requests to the Exposure API per process (default: 32)"
+        )
+        parser.add_argument(
+            "--interactive-reserve", 
+            type=int,
+            default=int(os.getenv("REDBEE_INTERACTIVE_RESERVE", "4")),
+            help="Upstream slots bulk listings can never use, kept for interactive tools (default: 4)"
+        )
+        
+        # Shutdown
+        parser.add_argument(
+            "--drain-timeout", 
+            type=float,
+            default=float(os.getenv("REDBEE_DRAIN_TIMEOUT", "20")),
+            help="Seconds in-flight tool calls get to finish on SIGTERM/SIGINT (default: 20)"
+        )
         
         # Red Bee configuration (required)
         parser.add_argument(
@@ -123,8 +221,14 @@ Usage examples:
 
     def create_config(self, args: argparse.Namespace):
         """Creates RedBeeConfig from parsed arguments."""
+        from .cache import DEFAULT_SHARED_CACHE_PATH
         from .models import RedBeeConfig
         
+        cache_path = args.cache_path
+        if not cache_path and args.workers > 1:
+            # Workers must share one cache instead of each holding its own copy
+            cache_path = DEFAULT_SHARED_CACHE_PATH
+        
         return RedBeeConfig(
             customer=args.customer or "",
             business_unit=args.business_unit or "",
@@ -132,7 +236,12 @@ Usage examples:
             username=args.username,
             session_token=args.session_token,
             device_id=args.device_id,
-            config_id=args.config_id
+            config_id=args.config_id,
+            cache_ttl=args.cache_ttl,
+            cache_path=cache_path,
+            upstream_concurrency=args.upstream_concurrency,
+            interactive_reserve=args.interactive_reserve,
+            drain_timeout=args.drain_timeout
         )
 
     def setup_environment(self, config):
@@ -148,11 +257,22 @@ Usage examples:
             os.environ["REDBEE_DEVICE_ID"] = config.device_id
         if config.config_id:
             os.environ["REDBEE_CONFIG_ID"] = config.config_id
+        os.environ["REDBEE_CACHE_TTL"] = str(config.cache_ttl)
+        if config.cache_path:
+            os.environ["REDBEE_CACHE_PATH"] = config.cache_path
+        os.environ["REDBEE_UPSTREAM_CONCURRENCY"] = str(config.upstream_concurrency)
+        os.environ["REDBEE_INTERACTIVE_RESERVE"] = str(config.interactive_reserve)
+        os.environ["REDBEE_DRAIN_TIMEOUT"] = str(config.drain_timeout)
+        from .http_server import HTTP_ENV_OPTIONS
+        for option, value in self.http_server_options().items():
+            os.environ[HTTP_ENV_OPTIONS[option][0]] = str(value)
 
-    def signal_handler(self, signum, frame):
-        """Handle shutdown signals gracefully."""
-        logger.info(f"Received signal {signum}, shutting down...")
-        sys.exit(0)
+    def http_server_options(self) -> Dict[str, Any]:
+        """HTTP server keyword options taken from the parsed arguments."""
+        from .http_server import HTTP_ENV_OPTIONS
+        if not self.args:
+            return {}
+        return {option: getattr(self.args, option) for option in HTTP_ENV_OPTIONS}
 
     async def run_stdio_server(self) -> None:
         """Run the MCP server in stdio mode."""
@@ -160,10 +280,7 @@ Usage examples:
         
         logger.info("Starting MCP server in stdio mode")
         
-        # Configure signal handlers
-        signal.signal(signal.SIGINT, self.signal_handler)
-        signal.signal(signal.SIGTERM, self.signal_handler)
-        
+        # SIGINT/SIGTERM are handled by the server, which drains in-flight calls
         try:
             await server_main()
         except Exception as e:
@@ -172,12 +289,20 @@ Usage examples:
 
     async def run_http_server(self, host: str = "0.0.0.0", port: int = 8000) -> None:
         """Run the HTTP/SSE server."""
-        from .http_server import start_http_server
+        from .http_server import run_http_workers, start_http_server
         
         logger.info(f"Starting MCP HTTP server on {host}:{port}")
         
+        workers = self.args.workers if self.args else 1
+        
+        if workers > 1:
+            # uvicorn's multi-process supervisor blocks and installs its own
+            # signal handlers, so it runs from the main thread directly
+            run_http_workers(host, port, workers, drain_timeout=self.config.drain_timeout)
+            return
+        
         try:
-            await start_http_server(self.config, host, port)
+            await start_http_server(self.config, host, port, **self.http_server_options())
         except Exception as e:
             logger.error(f"Error running HTTP server: {e}")
             raise
@@ -212,21 +337,42 @@ Usage examples:
         http_process = mp.Process(target=self.run_http_process, args=(host, port))
         http_process.start()
         
-        try:
-            # Wait for both processes to finish
-            stdio_process.join()
-            http_process.join()
-        except KeyboardInterrupt:
-            logger.info("Stopping both servers...")
-            stdio_process.terminate()
-            http_process.terminate()
-            stdio_process.join()
-            http_process.join()
+        processes = [stdio_process, http_process]
+        deadline: Optional[float] = None
+        
+        def drain_children(signum, frame):
+            nonlocal deadline
+            if deadline is not None:
+                return
+            logger.info(f"Received signal {signum}, draining both servers...")
+            # Both children drain on SIGTERM; a little slack covers their cleanup
+            deadline = time.monotonic() + self.config.drain_timeout + 5
+            for process in processes:
+                if process.is_alive():
+                    os.kill(process.pid, signal.SIGTERM)
+        
+        signal.signal(signal.SIGINT, drain_children)
+        signal.signal(signal.SIGTERM, drain_children)
+        
+        # Wait for both processes to finish
+        while any(process.is_alive() for process in processes):
+            for process in processes:
+                process.join(timeout=0.5)
+            if deadline is not None and time.monotonic() > deadline:
+                for process in processes:
+                    if process.is_alive():
+                        logger.warning(f"Process {process.pid} did not drain in time, terminating it")
+                        process.kill()
+                break
+        
+        for process in processes:
+            process.join()
 
     async def run(self) -> None:
         """Main entry point."""
         try:
             args = self.parse_args()
+            self.args = args
             self.config = self.create_config(args)
             
             # Configure environment
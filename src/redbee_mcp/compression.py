@@ -0,0 +1,185 @@
+"""
+Negotiated response compression for the HTTP server
+gzip is always available, brotli when the optional brotli package is installed
+"""
+
+import logging
+import zlib
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Responses smaller than this are sent uncompressed
+DEFAULT_MINIMUM_SIZE = 1024
+
+# gzip level (1-9); also used as brotli quality, capped at 11
+DEFAULT_COMPRESSION_LEVEL = 6
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+Message = Dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Picks the best encoding offered by the client that the server supports"""
+    offered = {}
+    for part in accept_encoding.split(","):
+        fields = part.strip().split(";")
+        name = fields[0].strip().lower()
+        quality = 1.0
+        for param in fields[1:]:
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            offered[name] = quality
+
+    for encoding in (["br"] if BROTLI_AVAILABLE else []) + ["gzip"]:
+        if offered.get(encoding, offered.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    """Incremental compressor with an explicit flush for streamed responses"""
+
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=min(level, 11))
+        else:
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, flush: bool = False) -> bytes:
+        if self.encoding == "br":
+            out = self._brotli.process(data)
+            return out + self._brotli.flush() if flush else out
+        out = self._zlib.compress(data)
+        return out + self._zlib.flush(zlib.Z_SYNC_FLUSH) if flush else out
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush(zlib.Z_FINISH)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing JSON and text responses
+
+    Complete responses below minimum_size are left untouched. Server-Sent
+    Events streams are compressed with a flush after every chunk so each
+    event reaches the client immediately; set compress_streams=False to send
+    them uncompressed.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Awaitable[None]],
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+        compress_streams: bool = True
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.level = level
+        self.compress_streams = compress_streams
+
+    async def __call__(self, scope: Message, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = ""
+        for key, value in scope.get("headers", []):
+            if key == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+                break
+
+        encoding = choose_encoding(accept_encoding)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressedResponder(self, encoding)(scope, receive, send)
+
+
+class _CompressedResponder:
+    """Compresses a single response"""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send: Send
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+        self.streaming = False
+
+    async def __call__(self, scope: Message, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    def _should_compress(self, headers: List[Any]) -> bool:
+        content_type = ""
+        for key, value in headers:
+            if key == b"content-encoding":
+                return False
+            if key == b"content-type":
+                content_type = value.decode("latin-1").lower()
+        if content_type.startswith("text/event-stream"):
+            self.streaming = True
+            return self.middleware.compress_streams
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def _compressed_headers(self, headers: List[Any]) -> List[Any]:
+        headers = [(k, v) for k, v in headers if k != b"content-length"]
+        headers.append((b"content-encoding", self.encoding.encode("latin-1")))
+        headers.append((b"vary", b"Accept-Encoding"))
+        return headers
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = list(message.get("headers", []))
+            if not self._should_compress(headers):
+                self.passthrough = True
+                await self.send(message)
+                return
+            # Hold the start message until the body size is known
+            self.start_message = dict(message, headers=headers)
+            return
+
+        if self.passthrough or message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            assert self.start_message is not None
+            if not more_body and not self.streaming and len(body) < self.middleware.minimum_size:
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+            self.compressor = _Compressor(self.encoding, self.middleware.level)
+            self.start_message["headers"] = self._compressed_headers(self.start_message["headers"])
+            await self.send(self.start_message)
+
+        if more_body:
+            data = self.compressor.compress(body, flush=self.streaming)
+        else:
+            data = self.compressor.compress(body) + self.compressor.finish()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -3,18 +3,23 @@ Main handler for MCP requests
 Extracts business logic to enable reuse in both stdio and HTTP modes
 """
 
+import asyncio
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from mcp.types import Tool, TextContent
 
+from .cache import ToolResultCache
 from .models import RedBeeConfig
-from .tools.content import CONTENT_TOOLS, search_content_v2, get_asset_details, get_playback_info, search_assets_autocomplete, get_epg_for_channel, get_episodes_for_season, get_public_asset_details, get_assets_by_tag, list_assets, search_multi_v3, get_asset_collection_entries, get_asset_thumbnail, get_seasons_for_series
+from .tools.content import CONTENT_TOOLS, PAGINATED_TOOLS, iter_listing_pages, search_content_v2, get_asset_details, get_playback_info, search_assets_autocomplete, get_epg_for_channel, get_episodes_for_season, get_public_asset_details, get_assets_by_tag, list_assets, search_multi_v3, get_asset_collection_entries, get_asset_thumbnail, get_seasons_for_series
 from .tools.auth import AUTH_TOOLS, login_user, create_anonymous_session, validate_session_token, logout_user
 from .tools.user_management import USER_MANAGEMENT_TOOLS, signup_user, change_user_password, get_user_profiles, add_user_profile, select_user_profile, get_user_preferences, set_user_preferences
 from .tools.purchases import PURCHASES_TOOLS, get_account_purchases, get_account_transactions, get_offerings, purchase_product_offering, cancel_purchase_subscription, get_stored_payment_methods, add_payment_method
 from .tools.system import SYSTEM_TOOLS, get_system_config_impl, get_system_time_impl, get_user_location_impl, get_active_channels_impl, get_user_devices_impl, delete_user_device_impl
+from .transport import configure_transport, lane_for_tool, upstream_lane
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +31,11 @@ class McpHandler:
     
     def __init__(self, config: Optional[RedBeeConfig] = None):
         self.config = config or self._get_config_from_env()
+        self.cache = ToolResultCache.from_config(self.config)
+        self.transport = configure_transport(self.config)
+        self.in_flight = 0
+        self.draining = False
+        self._idle: Optional[asyncio.Event] = None
     
     def _get_config_from_env(self) -> RedBeeConfig:
         """Retrieves configuration from environment variables"""
@@ -38,7 +48,12 @@ class McpHandler:
             password=os.getenv("REDBEE_PASSWORD"),
             session_token=os.getenv("REDBEE_SESSION_TOKEN"),
             device_id=os.getenv("REDBEE_DEVICE_ID"),
-            timeout=int(os.getenv("REDBEE_TIMEOUT", "30"))
+            timeout=int(os.getenv("REDBEE_TIMEOUT", "30")),
+            cache_ttl=int(os.getenv("REDBEE_CACHE_TTL", "30")),
+            cache_path=os.getenv("REDBEE_CACHE_PATH"),
+            upstream_concurrency=int(os.getenv("REDBEE_UPSTREAM_CONCURRENCY", "32")),
+            interactive_reserve=int(os.getenv("REDBEE_INTERACTIVE_RESERVE", "4")),
+            drain_timeout=float(os.getenv("REDBEE_DRAIN_TIMEOUT", "20"))
         )
     
     async def list_tools(self) -> List[Tool]:
@@ -55,16 +70,120 @@ class McpHandler:
         logger.info(f"Red Bee MCP: {len(tools)} available tools")
         return tools
     
+    def _config_error(self) -> Optional[List[TextContent]]:
+        """Minimal configuration validation, only done when calling a tool"""
+        if not self.config.customer or not self.config.business_unit:
+            return [TextContent(
+                type="text",
+                text="❌ Missing configuration: REDBEE_CUSTOMER and REDBEE_BUSINESS_UNIT are required.\n\nPlease configure:\n- REDBEE_CUSTOMER (e.g., CUSTOMER_NAME)\n- REDBEE_BUSINESS_UNIT (e.g., BUSINESS_UNIT_NAME)\n\nIn your mcp.json or as environment variables."
+            )]
+        return None
+    
+    async def stream_tool(self, name: str, arguments: dict, max_pages: int = 10) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Calls a tool and yields its result as a sequence of events
+        Paginated listings yield one "partial" event per fetched page, other
+        tools a single one. The last event is always "complete" or "error".
+        """
+        started = time.time()
+        yield {"type": "progress", "tool_name": name, "status": "started", "timestamp": started}
+        
+        config_error = self._config_error()
+        if config_error:
+            yield {"type": "error", "tool_name": name, "message": config_error[0].text}
+            return
+        
+        if name not in PAGINATED_TOOLS:
+            result = await self.call_tool(name, arguments)
+            yield {"type": "partial", "tool_name": name, "content": [content.model_dump() for content in result]}
+            yield {"type": "complete", "tool_name": name, "pages": 1, "elapsed": time.time() - started}
+            return
+        
+        pages = 0
+        items = 0
+        try:
+            async for page in iter_listing_pages(self.config, name, arguments, max_pages=max_pages):
+                pages += 1
+                items += len(page.get("items", []))
+                text = f"Red Bee Media {name} page {page['pageNumber']}:\n{json.dumps(page, indent=2, ensure_ascii=False)}"
+                yield {
+                    "type": "partial",
+                    "tool_name": name,
+                    "page": page["pageNumber"],
+                    "totalCount": page.get("totalCount"),
+                    "content": [TextContent(type="text", text=text).model_dump()]
+                }
+        except Exception as e:
+            logger.error(f"Error streaming tool {name}: {str(e)}")
+            yield {"type": "error", "tool_name": name, "message": f"Error executing tool {name}: {str(e)}", "pages": pages}
+            return
+        
+        yield {"type": "complete", "tool_name": name, "pages": pages, "items": items, "elapsed": time.time() - started}
+    
     async def call_tool(self, name: str, arguments: dict) -> List[TextContent]:
         """Main handler for MCP tool calls"""
         
-        # Minimal configuration validation only when calling a tool
-        if not self.config.customer or not self.config.business_unit:
+        config_error = self._config_error()
+        if config_error:
+            return config_error
+        
+        if self.draining:
             return [TextContent(
                 type="text",
-                text="❌ Missing configuration: REDBEE_CUSTOMER and REDBEE_BUSINESS_UNIT are required.\n\nPlease configure:\n- REDBEE_CUSTOMER (e.g., CUSTOMER_NAME)\n- REDBEE_BUSINESS_UNIT (e.g., BUSINESS_UNIT_NAME)\n\nIn your mcp.json or as environment variables."
+                text=f"❌ Server is shutting down, tool '{name}' was not executed. Please retry."
             )]
         
+        self.in_flight += 1
+        try:
+            return await self._call_tool(name, arguments)
+        finally:
+            self.in_flight -= 1
+            if self.in_flight == 0 and self._idle is not None:
+                self._idle.set()
+    
+    async def _call_tool(self, name: str, arguments: dict) -> List[TextContent]:
+        """Serves a tool call from the cache or executes it"""
+        if self.cache:
+            cached = await self.cache.get(name, arguments)
+            if cached is not None:
+                logger.info(f"Red Bee MCP: Cache hit for tool '{name}'")
+                return cached
+        
+        with upstream_lane(lane_for_tool(name)):
+            result = await self._execute_tool(name, arguments)
+        
+        if self.cache:
+            await self.cache.set(name, arguments, result)
+        
+        return result
+    
+    async def drain(self, timeout: float) -> bool:
+        """
+        Stops accepting tool calls and waits for in-flight ones to finish
+        Returns False if some calls were still running after timeout seconds
+        """
+        self.draining = True
+        if self.in_flight == 0:
+            return True
+        logger.info(f"Red Bee MCP: Draining {self.in_flight} in-flight tool call(s), up to {timeout}s")
+        self._idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.warning(f"Red Bee MCP: {self.in_flight} tool call(s) still running after {timeout}s drain")
+            return False
+    
+    async def close(self) -> None:
+        """Flushes the cache and closes upstream connections"""
+        if self.cache:
+            logger.info(f"Red Bee MCP: Cache stats at shutdown: {self.cache.hits} hits, {self.cache.misses} misses")
+            await self.cache.close()
+        await self.transport.close()
+    
+    async def _execute_tool(self, name: str, arguments: dict) -> List[TextContent]:
+        """Dispatches a tool call to its implementation"""
+        
         try:
             logger.info(f"Red Bee MCP: Calling tool '{name}' with arguments: {arguments}")
             
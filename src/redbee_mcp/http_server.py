@@ -4,33 +4,72 @@ Enables exposing MCP functionality via HTTP instead of stdio
 """
 
 import asyncio
-import json
 import logging
+import math
+import os
+import signal
 import time
-import uuid
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, AsyncGenerator, AsyncIterator, Union
 
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import Body, FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
+from .admission import (
+    DEFAULT_MAX_CONCURRENT_CALLS,
+    DEFAULT_MAX_QUEUE_WAIT,
+    DEFAULT_MAX_QUEUED_CALLS,
+    OVERLOADED_ERROR_CODE,
+    AdmissionController,
+    OverloadedError,
+)
+from .compression import DEFAULT_COMPRESSION_LEVEL, DEFAULT_MINIMUM_SIZE, CompressionMiddleware
 from .handler import McpHandler
 from .models import RedBeeConfig
+from .ratelimit import (
+    DEFAULT_MAX_BUCKETS,
+    DEFAULT_RATE_LIMITS,
+    RATE_LIMITED_ERROR_CODE,
+    RateLimitedError,
+    TokenBucketLimiter,
+    client_identity,
+    parse_rate_limits,
+)
+from .sse import DEFAULT_HEARTBEAT_INTERVAL, SseHub, format_event
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of requests of a JSON-RPC batch executed at the same time
+DEFAULT_BATCH_CONCURRENCY = 8
+
+# Maximum number of pages fetched by a streamed paginated listing
+DEFAULT_STREAM_MAX_PAGES = 10
+
+# McpHttpServer options settable from the environment: option -> (variable, type)
+HTTP_ENV_OPTIONS = {
+    "batch_concurrency": ("REDBEE_BATCH_CONCURRENCY", int),
+    "compression_min_size": ("REDBEE_COMPRESSION_MIN_SIZE", int),
+    "compression_level": ("REDBEE_COMPRESSION_LEVEL", int),
+    "max_concurrent_calls": ("REDBEE_MAX_CONCURRENT_CALLS", int),
+    "max_queued_calls": ("REDBEE_MAX_QUEUED_CALLS", int),
+    "max_queue_wait": ("REDBEE_MAX_QUEUE_WAIT", float),
+    "rate_limits": ("REDBEE_RATE_LIMITS", str),
+    "rate_limit_max_buckets": ("REDBEE_RATE_LIMIT_MAX_BUCKETS", int),
+}
+
 # Pydantic models for JSON-RPC requests
 class JsonRpcRequest(BaseModel):
     jsonrpc: str = Field(default="2.0", description="JSON-RPC version")
     method: str = Field(description="Method to call")
     params: Optional[Dict[str, Any]] = Field(default=None, description="Method parameters")
-    id: Optional[str] = Field(default=None, description="Request ID")
+    id: Optional[Union[str, int]] = Field(default=None, description="Request ID")
 
 class JsonRpcResponse(BaseModel):
     jsonrpc: str = Field(default="2.0", description="JSON-RPC version")
-    id: Optional[str] = Field(description="Request ID")
+    id: Optional[Union[str, int]] = Field(description="Request ID")
     result: Optional[Any] = Field(default=None, description="Method result")
     error: Optional[Dict[str, Any]] = Field(default=None, description="Error if any")
 
@@ -40,15 +79,36 @@ class McpHttpServer:
     Compatible with JSON-RPC 2.0 protocol
     """
     
-    def __init__(self, config: Optional[RedBeeConfig] = None, host: str = "0.0.0.0", port: int = 8000):
+    def __init__(
+        self,
+        config: Optional[RedBeeConfig] = None,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        sse_heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+        compression_min_size: int = DEFAULT_MINIMUM_SIZE,
+        compression_level: int = DEFAULT_COMPRESSION_LEVEL,
+        max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+        max_queued_calls: int = DEFAULT_MAX_QUEUED_CALLS,
+        max_queue_wait: float = DEFAULT_MAX_QUEUE_WAIT,
+        rate_limits: str = DEFAULT_RATE_LIMITS,
+        rate_limit_max_buckets: int = DEFAULT_MAX_BUCKETS
+    ):
         self.config = config
         self.host = host
         self.port = port
+        self.batch_concurrency = max(1, batch_concurrency)
         self.handler = McpHandler(config)
+        self.admission = AdmissionController(max_concurrent_calls, max_queued_calls, max_queue_wait)
+        self.rate_limiter = TokenBucketLimiter(parse_rate_limits(rate_limits), rate_limit_max_buckets)
+        self.sse_hub = SseHub(self._tools_data, heartbeat_interval=sse_heartbeat_interval)
+        self.drain_timeout = self.handler.config.drain_timeout
+        self.draining = False
         self.app = FastAPI(
             title="Red Bee MCP Server",
             description="MCP Server for Red Bee Media OTT Platform via HTTP/SSE",
-            version="1.0.0"
+            version="1.0.0",
+            lifespan=self._lifespan
         )
         
         # Configure CORS to allow requests from browser
@@ -60,6 +120,14 @@ class McpHttpServer:
             allow_headers=["*"],
         )
         
+        # Compress large JSON-RPC results and SSE streams (level 0 disables)
+        if compression_level > 0:
+            self.app.add_middleware(
+                CompressionMiddleware,
+                minimum_size=compression_min_size,
+                level=compression_level
+            )
+        
         self._setup_routes()
     
     def _setup_routes(self):
@@ -81,69 +149,49 @@ class McpHttpServer:
         
         @self.app.get("/health")
         async def health_check():
-            """Server health check"""
-            return {
-                "status": "healthy",
+            """Server health check, 503 while draining so load balancers stop routing here"""
+            health = {
+                "status": "draining" if self.draining else "healthy",
                 "timestamp": time.time(),
-                "tools_count": len(await self.handler.list_tools())
+                "tools_count": len(await self.handler.list_tools()),
+                "admission": self.admission.stats(),
+                "rate_limit": self.rate_limiter.stats(),
+                "upstream": self.handler.transport.stats()
             }
+            if self.draining:
+                return JSONResponse(status_code=503, content=health)
+            return health
         
-        @self.app.post("/", response_model=JsonRpcResponse)
-        async def handle_jsonrpc(request: JsonRpcRequest):
+        @self.app.post("/", response_model=Union[JsonRpcResponse, List[JsonRpcResponse]])
+        async def handle_jsonrpc(http_request: Request, payload: Union[List[Any], JsonRpcRequest] = Body(...)):
             """
             Main endpoint for JSON-RPC MCP requests
-            Compatible with list_tools and call_tool
+            Compatible with list_tools and call_tool, single requests or batches
             """
-            try:
-                logger.info(f"JSON-RPC request: {request.method}")
-                
-                if request.method == "tools/list":
-                    # List all available tools
-                    tools = await self.handler.list_tools()
-                    tools_data = [tool.model_dump() for tool in tools]
-                    
-                    return JsonRpcResponse(
-                        id=request.id,
-                        result={"tools": tools_data}
-                    )
-                
-                elif request.method == "tools/call":
-                    # Call a specific tool
-                    if not request.params:
-                        raise HTTPException(status_code=400, detail="Parameters required for tools/call")
-                    
-                    tool_name = request.params.get("name")
-                    tool_arguments = request.params.get("arguments", {})
-                    
-                    if not tool_name:
-                        raise HTTPException(status_code=400, detail="Tool name required")
-                    
-                    result = await self.handler.call_tool(tool_name, tool_arguments)
-                    result_data = [content.model_dump() for content in result]
-                    
-                    return JsonRpcResponse(
-                        id=request.id,
-                        result={"content": result_data}
-                    )
-                
-                else:
-                    return JsonRpcResponse(
-                        id=request.id,
-                        error={
-                            "code": -32601,
-                            "message": f"Unknown method: {request.method}"
-                        }
+            client = self._client_identity(http_request)
+            
+            if isinstance(payload, JsonRpcRequest):
+                response = await self._dispatch(payload, client)
+                error_code = response.error.get("code") if response.error else None
+                if error_code in (OVERLOADED_ERROR_CODE, RATE_LIMITED_ERROR_CODE):
+                    # Let proxies and HTTP clients see the overload too
+                    return JSONResponse(
+                        status_code=503 if error_code == OVERLOADED_ERROR_CODE else 429,
+                        content=response.model_dump(),
+                        headers={"Retry-After": str(math.ceil(response.error["data"]["retryAfter"]))}
                     )
-                    
-            except Exception as e:
-                logger.error(f"Error processing JSON-RPC request: {str(e)}")
+                return response
+            
+            if not payload:
                 return JsonRpcResponse(
-                    id=request.id,
+                    id=None,
                     error={
-                        "code": -32603,
-                        "message": f"Internal error: {str(e)}"
+                        "code": -32600,
+                        "message": "Invalid Request: empty batch"
                     }
                 )
+            
+            return await self._dispatch_batch(payload, client)
         
         @self.app.get("/sse")
         async def sse_endpoint(request: Request):
@@ -151,40 +199,8 @@ class McpHttpServer:
             Server-Sent Events endpoint for streaming
             Enables real-time communication with client
             """
-            async def event_generator() -> AsyncGenerator[str, None]:
-                client_id = str(uuid.uuid4())
-                logger.info(f"New SSE connection: {client_id}")
-                
-                try:
-                    # Send welcome message
-                    yield f"data: {json.dumps({'type': 'welcome', 'client_id': client_id, 'timestamp': time.time()})}\n\n"
-                    
-                    # Send list of available tools
-                    tools = await self.handler.list_tools()
-                    tools_data = [tool.model_dump() for tool in tools]
-                    yield f"data: {json.dumps({'type': 'tools', 'tools': tools_data})}\n\n"
-                    
-                    # Keep connection alive
-                    while True:
-                        # Check if client is still connected
-                        if await request.is_disconnected():
-                            logger.info(f"SSE client disconnected: {client_id}")
-                            break
-                        
-                        # Send periodic ping
-                        yield f"data: {json.dumps({'type': 'ping', 'timestamp': time.time()})}\n\n"
-                        
-                        # Wait before next ping
-                        await asyncio.sleep(30)
-                        
-                except Exception as e:
-                    logger.error(f"SSE error for client {client_id}: {str(e)}")
-                    yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
-                finally:
-                    logger.info(f"SSE connection ended: {client_id}")
-            
             return StreamingResponse(
-                event_generator(),
+                self.sse_hub.stream(),
                 media_type="text/event-stream",
                 headers={
                     "Cache-Control": "no-cache",
@@ -194,10 +210,12 @@ class McpHttpServer:
             )
         
         @self.app.post("/sse/call")
-        async def sse_call_tool(request: JsonRpcRequest):
+        async def sse_call_tool(request: JsonRpcRequest, http_request: Request):
             """
             Endpoint to call a tool via SSE
-            Returns result immediately (no streaming for tools)
+            With "Accept: text/event-stream" the result is streamed as events
+            (progress, one partial per page for paginated listings, complete);
+            otherwise the whole result is returned at once
             """
             try:
                 if request.method != "tools/call":
@@ -212,7 +230,28 @@ class McpHttpServer:
                 if not tool_name:
                     raise HTTPException(status_code=400, detail="Tool name required")
                 
-                result = await self.handler.call_tool(tool_name, tool_arguments)
+                try:
+                    self.rate_limiter.check(self._client_identity(http_request), tool_name)
+                except RateLimitedError as e:
+                    raise HTTPException(
+                        status_code=429,
+                        detail=e.message,
+                        headers={"Retry-After": str(math.ceil(e.retry_after))}
+                    )
+                
+                if "text/event-stream" in http_request.headers.get("accept", ""):
+                    max_pages = int(request.params.get("maxPages", DEFAULT_STREAM_MAX_PAGES))
+                    return self._stream_tool_response(request.id, tool_name, tool_arguments, max_pages)
+                
+                try:
+                    async with self.admission.admit():
+                        result = await self.handler.call_tool(tool_name, tool_arguments)
+                except OverloadedError as e:
+                    raise HTTPException(
+                        status_code=503,
+                        detail=e.message,
+                        headers={"Retry-After": str(math.ceil(e.retry_after))}
+                    )
                 result_data = [content.model_dump() for content in result]
                 
                 return {
@@ -222,10 +261,205 @@ class McpHttpServer:
                     "timestamp": time.time()
                 }
                 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Error calling SSE tool: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
     
+    def _stream_tool_response(
+        self,
+        request_id: Optional[Union[str, int]],
+        tool_name: str,
+        tool_arguments: Dict[str, Any],
+        max_pages: int
+    ) -> StreamingResponse:
+        """Streams the events of a tool call as Server-Sent Events"""
+        async def event_generator() -> AsyncGenerator[str, None]:
+            try:
+                async with self.admission.admit():
+                    async for event in self.handler.stream_tool(tool_name, tool_arguments, max_pages=max_pages):
+                        event["id"] = request_id
+                        yield format_event(event)
+            except OverloadedError as e:
+                yield format_event({
+                    "type": "error",
+                    "id": request_id,
+                    "tool_name": tool_name,
+                    "code": OVERLOADED_ERROR_CODE,
+                    "message": e.message,
+                    "retryAfter": e.retry_after
+                })
+        
+        return StreamingResponse(
+            event_generator(),
+            media_type="text/event-stream",
+            headers={
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no"  # For nginx
+            }
+        )
+    
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Hooks shutdown signals on startup and releases resources on shutdown"""
+        self._install_drain_signals()
+        yield
+        await self.shutdown()
+    
+    def _install_drain_signals(self) -> None:
+        """
+        Starts draining as soon as SIGINT/SIGTERM arrives
+        uvicorn's own handler still runs afterwards: it stops accepting
+        connections and waits up to drain_timeout for in-flight requests
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+            
+            def handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(self.begin_drain)
+                previous(signum, frame)
+            
+            try:
+                signal.signal(sig, handler)
+            except ValueError:
+                # Not running in the main thread
+                return
+    
+    def begin_drain(self) -> None:
+        """Refuses new tool calls and ends idle SSE streams"""
+        if self.draining:
+            return
+        self.draining = True
+        logger.info(f"Draining HTTP server: {self.admission.in_flight} tool call(s) in flight, up to {self.drain_timeout}s")
+        self.admission.draining = True
+        asyncio.ensure_future(self.sse_hub.close())
+    
+    async def shutdown(self) -> None:
+        """Finishes draining, then flushes the cache and closes upstream connections"""
+        self.begin_drain()
+        await self.handler.drain(self.drain_timeout)
+        await self.sse_hub.close()
+        await self.handler.close()
+        logger.info(f"HTTP server stopped: admission {self.admission.stats()}, rate limit {self.rate_limiter.stats()}")
+    
+    async def _tools_data(self) -> List[Dict[str, Any]]:
+        """Serializable description of all tools"""
+        tools = await self.handler.list_tools()
+        return [tool.model_dump() for tool in tools]
+    
+    def _client_identity(self, http_request: Request) -> str:
+        """Identifies the caller for rate limiting"""
+        headers = http_request.headers
+        return client_identity(
+            api_key=headers.get("x-api-key"),
+            authorization=headers.get("authorization"),
+            session_id=headers.get("mcp-session-id"),
+            address=http_request.client.host if http_request.client else None
+        )
+    
+    async def _dispatch(self, request: JsonRpcRequest, client: str = "local") -> JsonRpcResponse:
+        """Executes a single JSON-RPC request and builds its response"""
+        try:
+            logger.info(f"JSON-RPC request: {request.method}")
+            
+            if request.method == "tools/list":
+                # List all available tools
+                tools = await self.handler.list_tools()
+                tools_data = [tool.model_dump() for tool in tools]
+                
+                return JsonRpcResponse(
+                    id=request.id,
+                    result={"tools": tools_data}
+                )
+            
+            elif request.method == "tools/call":
+                # Call a specific tool
+                if not request.params:
+                    raise HTTPException(status_code=400, detail="Parameters required for tools/call")
+                
+                tool_name = request.params.get("name")
+                tool_arguments = request.params.get("arguments", {})
+                
+                if not tool_name:
+                    raise HTTPException(status_code=400, detail="Tool name required")
+                
+                self.rate_limiter.check(client, tool_name)
+                
+                async with self.admission.admit():
+                    result = await self.handler.call_tool(tool_name, tool_arguments)
+                result_data = [content.model_dump() for content in result]
+                
+                return JsonRpcResponse(
+                    id=request.id,
+                    result={"content": result_data}
+                )
+            
+            else:
+                return JsonRpcResponse(
+                    id=request.id,
+                    error={
+                        "code": -32601,
+                        "message": f"Unknown method: {request.method}"
+                    }
+                )
+                
+        except RateLimitedError as e:
+            return JsonRpcResponse(
+                id=request.id,
+                error={
+                    "code": RATE_LIMITED_ERROR_CODE,
+                    "message": e.message,
+                    "data": {"retryAfter": e.retry_after}
+                }
+            )
+        except OverloadedError as e:
+            return JsonRpcResponse(
+                id=request.id,
+                error={
+                    "code": OVERLOADED_ERROR_CODE,
+                    "message": e.message,
+                    "data": {"retryAfter": e.retry_after}
+                }
+            )
+        except Exception as e:
+            logger.error(f"Error processing JSON-RPC request: {str(e)}")
+            return JsonRpcResponse(
+                id=request.id,
+                error={
+                    "code": -32603,
+                    "message": f"Internal error: {str(e)}"
+                }
+            )
+    
+    async def _dispatch_batch(self, batch: List[Any], client: str = "local") -> List[JsonRpcResponse]:
+        """
+        Executes a JSON-RPC batch concurrently, at most batch_concurrency at a time
+        Responses are returned in request order
+        """
+        logger.info(f"JSON-RPC batch of {len(batch)} requests")
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+        
+        async def run_one(item: Any) -> JsonRpcResponse:
+            try:
+                request = JsonRpcRequest.model_validate(item)
+            except ValidationError as e:
+                return JsonRpcResponse(
+                    id=item.get("id") if isinstance(item, dict) and isinstance(item.get("id"), (str, int)) else None,
+                    error={
+                        "code": -32600,
+                        "message": f"Invalid Request: {e.errors()[0]['msg'] if e.errors() else str(e)}"
+                    }
+                )
+            
+            async with semaphore:
+                return await self._dispatch(request, client)
+        
+        return list(await asyncio.gather(*(run_one(item) for item in batch)))
+    
     async def start(self):
         """Starts the HTTP server"""
         logger.info(f"Starting MCP HTTP server on {self.host}:{self.port}")
@@ -235,17 +469,60 @@ class McpHttpServer:
             host=self.host,
             port=self.port,
             log_level="info",
-            access_log=True
+            access_log=True,
+            timeout_graceful_shutdown=self.drain_timeout
         )
         
         server = uvicorn.Server(config)
         await server.serve()
 
-async def start_http_server(config: Optional[RedBeeConfig] = None, host: str = "0.0.0.0", port: int = 8000):
+def http_options_from_env() -> Dict[str, Any]:
+    """Reads the McpHttpServer options set in the environment"""
+    return {
+        option: cast(os.environ[variable])
+        for option, (variable, cast) in HTTP_ENV_OPTIONS.items()
+        if variable in os.environ
+    }
+
+def create_app() -> FastAPI:
+    """
+    Application factory used by uvicorn worker processes
+    Configuration is read from the REDBEE_* environment variables
+    """
+    server = McpHttpServer(**http_options_from_env())
+    return server.app
+
+def run_http_workers(host: str = "0.0.0.0", port: int = 8000, workers: int = 2, drain_timeout: float = 20.0):
+    """
+    Runs the HTTP server with several pre-forked uvicorn worker processes
+    The parent binds the socket once and every worker accepts from it.
+    Workers rebuild their configuration from the environment, so shared
+    state must live in the shared cache backend (REDBEE_CACHE_PATH).
+    On SIGTERM each worker drains for up to drain_timeout seconds.
+    """
+    logger.info(f"Starting MCP HTTP server on {host}:{port} with {workers} workers")
+    uvicorn.run(
+        "redbee_mcp.http_server:create_app",
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info",
+        access_log=True,
+        timeout_graceful_shutdown=drain_timeout
+    )
+
+async def start_http_server(
+    config: Optional[RedBeeConfig] = None,
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    **options: Any
+):
     """
     Helper function to start the HTTP server
+    Extra keyword options are passed to McpHttpServer
     """
-    server = McpHttpServer(config, host, port)
+    server = McpHttpServer(config, host, port, **options)
     await server.start()
 
 if __name__ == "__main__":
@@ -19,6 +19,11 @@ class RedBeeConfig(BaseModel):
     username: Optional[str] = Field(default=None, description="Username for authentication")
     password: Optional[str] = Field(default=None, description="Password for authentication")
     timeout: int = Field(default=30, description="Request timeout in seconds")
+    cache_ttl: int = Field(default=30, description="Tool result cache TTL in seconds (0 disables the cache)")
+    cache_path: Optional[str] = Field(default=None, description="SQLite file shared by all workers for the tool cache (in-memory if unset)")
+    upstream_concurrency: int = Field(default=32, description="Maximum concurrent upstream requests per process")
+    interactive_reserve: int = Field(default=4, description="Upstream slots bulk tools can never take, kept for interactive tools")
+    drain_timeout: float = Field(default=20.0, description="Seconds in-flight tool calls get to finish on shutdown")
 
 
 class AuthenticationResponse(BaseModel):
@@ -0,0 +1,142 @@
+"""
+Per-client token-bucket rate limiting for tool calls
+Each client gets one bucket per tool cost class; state is bounded in size
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# JSON-RPC error code returned when a client exceeds its rate
+RATE_LIMITED_ERROR_CODE = -32001
+
+# Default bucket per cost class: "class=rate/burst" with rate in calls per second
+DEFAULT_RATE_LIMITS = "light=20/40,standard=5/20,heavy=1/5"
+
+# Maximum number of (client, class) buckets kept in memory
+DEFAULT_MAX_BUCKETS = 10000
+
+# Tools not listed here belong to the "standard" class
+TOOL_COST_CLASSES = {
+    "search_assets_autocomplete": "light",
+    "get_system_time": "light",
+    "get_system_config": "light",
+    "get_user_location": "light",
+    "get_public_asset_details": "light",
+    "validate_session_token": "light",
+    "search_content_v2": "heavy",
+    "search_multi_v3": "heavy",
+    "list_assets": "heavy",
+    "get_epg_for_channel": "heavy",
+    "get_account_transactions": "heavy",
+    "get_account_purchases": "heavy",
+}
+
+
+class RateLimitedError(Exception):
+    """Raised when a client has no tokens left for a call"""
+
+    def __init__(self, message: str, retry_after: float):
+        self.message = message
+        self.retry_after = retry_after
+        super().__init__(self.message)
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """
+    Parses "class=rate/burst,..." into {class: (rate, burst)}
+    An empty spec or "off" disables rate limiting
+    """
+    limits: Dict[str, Tuple[float, float]] = {}
+    if not spec or spec.strip().lower() == "off":
+        return limits
+    for part in spec.split(","):
+        name, _, value = part.strip().partition("=")
+        rate, _, burst = value.partition("/")
+        try:
+            limits[name.strip()] = (float(rate), float(burst or rate))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit '{part}', expected class=rate/burst")
+    return limits
+
+
+def client_identity(
+    api_key: Optional[str] = None,
+    authorization: Optional[str] = None,
+    session_id: Optional[str] = None,
+    address: Optional[str] = None
+) -> str:
+    """
+    Picks the most specific identity available for a caller
+    Credentials are hashed so raw secrets are never kept in limiter state
+    """
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+    if authorization:
+        return "auth:" + hashlib.sha256(authorization.encode("utf-8")).hexdigest()[:16]
+    if session_id:
+        return f"session:{session_id}"
+    return f"ip:{address or 'unknown'}"
+
+
+class TokenBucketLimiter:
+    """
+    Token buckets keyed by (client, cost class)
+
+    Buckets live in an LRU of at most max_buckets entries. A bucket idle long
+    enough to refill completely is identical to a new one, so evicting idle
+    keys loses nothing; under key pressure the least recently used go first.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]], max_buckets: int = DEFAULT_MAX_BUCKETS):
+        self.limits = limits
+        self.max_buckets = max(1, max_buckets)
+        self.limited = 0
+        # (client, class) -> (tokens, last refill time)
+        self._buckets: "OrderedDict[Tuple[str, str], Tuple[float, float]]" = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.limits)
+
+    @staticmethod
+    def cost_class(tool_name: str) -> str:
+        return TOOL_COST_CLASSES.get(tool_name, "standard")
+
+    def _evict_idle(self, now: float) -> None:
+        while self._buckets:
+            key, (tokens, last) = next(iter(self._buckets.items()))
+            rate, burst = self.limits.get(key[1], (1.0, 1.0))
+            full = tokens + (now - last) * rate >= burst
+            if not full and len(self._buckets) <= self.max_buckets:
+                break
+            del self._buckets[key]
+
+    def check(self, client: str, tool_name: str) -> None:
+        """Takes one token for the call or raises RateLimitedError"""
+        cost_class = self.cost_class(tool_name)
+        if cost_class not in self.limits:
+            return
+        rate, burst = self.limits[cost_class]
+        now = time.monotonic()
+        key = (client, cost_class)
+
+        tokens, last = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate)
+
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            self.limited += 1
+            retry_after = (1.0 - tokens) / rate if rate > 0 else 60.0
+            logger.warning(f"Rate limited {client} on {cost_class} tool {tool_name}")
+            raise RateLimitedError(f"Rate limit exceeded for {cost_class} tools", round(retry_after, 2))
+
+        self._buckets[key] = (tokens - 1.0, now)
+        self._evict_idle(now)
+
+    def stats(self) -> Dict[str, int]:
+        return {"buckets": len(self._buckets), "limited": self.limited}
@@ -6,6 +6,7 @@ Documentation: https://exposure.api.redbee.live/docs
 
 import asyncio
 import logging
+import signal
 from typing import List
 
 from mcp.server import Server
@@ -48,26 +49,53 @@ async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
             text=f"Error: {str(e)}"
         )]
 
+async def drain_and_stop(task: asyncio.Task) -> None:
+    """Lets in-flight tool calls finish, then stops the stdio server task"""
+    await mcp_handler.drain(mcp_handler.config.drain_timeout)
+    task.cancel()
+
 async def main():
     """Main entry point for the MCP stdio server"""
     # No startup logs to avoid stdout pollution in MCP mode
     
     # Server always starts, validation happens when tools are called
     
+    # SIGINT/SIGTERM drain in-flight tool calls instead of cutting them off
+    main_task = asyncio.current_task()
+    loop = asyncio.get_running_loop()
+    
+    def request_shutdown():
+        if not mcp_handler.draining:
+            logger.info("Shutdown requested, draining tool calls")
+            asyncio.ensure_future(drain_and_stop(main_task))
+    
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, request_shutdown)
+        except (NotImplementedError, RuntimeError):
+            # Not supported on Windows or outside the main thread
+            pass
+    
     # Start the MCP server
     from mcp.server.stdio import stdio_server
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="redbee-mcp",
-                server_version="1.0.0",
-                capabilities=ServerCapabilities(
-                    tools={}
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="redbee-mcp",
+                    server_version="1.0.0",
+                    capabilities=ServerCapabilities(
+                        tools={}
+                    )
                 )
             )
-        )
+    except asyncio.CancelledError:
+        if not mcp_handler.draining:
+            raise
+    finally:
+        await mcp_handler.close()
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
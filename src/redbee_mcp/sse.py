@@ -0,0 +1,120 @@
+"""
+Server-Sent Events hub for the HTTP server
+One timer drives heartbeats for every subscriber, and the tools payload is
+serialized once and shared by all connections
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Interval between two heartbeat pings, in seconds
+DEFAULT_HEARTBEAT_INTERVAL = 30.0
+
+
+def format_event(data: Dict[str, Any]) -> str:
+    """Formats a payload as an SSE data frame"""
+    return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+class SseHub:
+    """
+    Fans out broadcast frames to all SSE subscribers
+
+    Subscribers do not own a queue or a timer: they all wait on the same
+    pending future, which the hub resolves with the next frame. A connection
+    therefore costs its generator frame plus one shielded waiter.
+    """
+
+    def __init__(
+        self,
+        tools_loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL
+    ):
+        self.tools_loader = tools_loader
+        self.heartbeat_interval = heartbeat_interval
+        self.subscribers = 0
+        self._tools_frame: Optional[str] = None
+        self._next_frame: Optional["asyncio.Future[Optional[str]]"] = None
+        self._heartbeat_task: Optional["asyncio.Task[None]"] = None
+
+    async def tools_frame(self) -> str:
+        """Returns the serialized tools event, built on first use"""
+        if self._tools_frame is None:
+            tools = await self.tools_loader()
+            self._tools_frame = format_event({"type": "tools", "tools": tools})
+        return self._tools_frame
+
+    def invalidate_tools(self) -> None:
+        """Forgets the cached tools event so the next connection rebuilds it"""
+        self._tools_frame = None
+
+    def _ensure_started(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._next_frame is None or self._next_frame.done():
+            self._next_frame = loop.create_future()
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = loop.create_task(self._heartbeat())
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            if self.subscribers:
+                self.publish({"type": "ping", "timestamp": time.time()})
+
+    def publish(self, data: Dict[str, Any]) -> None:
+        """Sends one event to every connected subscriber"""
+        self._publish_frame(format_event(data))
+
+    def _publish_frame(self, frame: Optional[str]) -> None:
+        if self._next_frame is None:
+            return
+        current = self._next_frame
+        self._next_frame = asyncio.get_running_loop().create_future()
+        if not current.done():
+            current.set_result(frame)
+
+    async def stream(self) -> AsyncGenerator[str, None]:
+        """Event stream of one SSE connection"""
+        self._ensure_started()
+        client_id = str(uuid.uuid4())
+        self.subscribers += 1
+        logger.debug(f"New SSE connection: {client_id} ({self.subscribers} connected)")
+
+        try:
+            yield format_event({"type": "welcome", "client_id": client_id, "timestamp": time.time()})
+            yield await self.tools_frame()
+            # Ping right away so clients see the first heartbeat without waiting a full interval
+            yield format_event({"type": "ping", "timestamp": time.time()})
+
+            while True:
+                # Shielded so a cancelled connection does not cancel the shared future
+                frame = await asyncio.shield(self._next_frame)
+                if frame is None:
+                    break
+                yield frame
+
+        except Exception as e:
+            logger.error(f"SSE error for client {client_id}: {str(e)}")
+            yield format_event({"type": "error", "message": str(e)})
+        finally:
+            self.subscribers -= 1
+            logger.debug(f"SSE connection ended: {client_id}")
+
+    async def close(self) -> None:
+        """Ends every subscriber stream and stops the heartbeat timer"""
+        # The resolved future is left in place so late waiters also see the end
+        if self._next_frame is not None and not self._next_frame.done():
+            self._next_frame.set_result(None)
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
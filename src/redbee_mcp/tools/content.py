@@ -4,12 +4,14 @@ MCP Tools for Red Bee Media Content Management
 This module provides content-related tools for Red Bee Media platform.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 from mcp.types import Tool, TextContent
 
 from ..client import RedBeeClient, RedBeeAPIError
 from ..models import RedBeeConfig
+from ..transport import BULK, get_transport
 
 
 async def get_public_asset_details(
@@ -21,8 +23,6 @@ async def get_public_asset_details(
     """Retrieves asset details via public endpoint (without authentication)"""
     
     try:
-        import aiohttp
-        
         url = f"https://exposure.api.redbee.live/v1/customer/{config.customer}/businessunit/{config.business_unit}/content/asset/{assetId}"
         params = {
             "onlyPublished": str(onlyPublished).lower(),
@@ -33,21 +33,20 @@ async def get_public_asset_details(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Asset Details (Public):\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
-                    
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Asset Details (Public):\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
+            
     except Exception as e:
         return [TextContent(
             type="text",
@@ -80,8 +79,6 @@ async def search_content_v2(
     """Search V2 - Free text query in selected fields in assets (including descriptions)"""
     
     try:
-        import aiohttp
-        
         url = f"https://exposure.api.redbee.live/v2/customer/{config.customer}/businessunit/{config.business_unit}/content/search/query/{query}"
         
         params = {
@@ -131,20 +128,19 @@ async def search_content_v2(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Search V2 Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Search V2 Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
             
     except Exception as e:
         return [TextContent(
@@ -238,8 +234,6 @@ async def search_assets_autocomplete(
     """Asset search autocompletion via v3 endpoint (WITHOUT authentication)"""
     
     try:
-        import aiohttp
-        
         # Utiliser l'endpoint v3 public selon la documentation avec les variables d'environnement
         url = f"https://exposure.api.redbee.live/v3/customer/{config.customer}/businessunit/{config.business_unit}/content/search/asset/title/autocomplete/{query}"
         
@@ -251,20 +245,19 @@ async def search_assets_autocomplete(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Autocomplete Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Autocomplete Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
             
     except Exception as e:
         return [TextContent(
@@ -368,8 +361,6 @@ async def get_assets_by_tag(
     """Retrieves unique asset tags for a given type (WITHOUT authentication)"""
     
     try:
-        import aiohttp
-        
         # Use public v1 endpoint according to documentation
         url = f"https://exposure.api.redbee.live/v1/customer/{config.customer}/businessunit/{config.business_unit}/tag/asset"
         
@@ -385,20 +376,19 @@ async def get_assets_by_tag(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media {tagType} Tags for Assets:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media {tagType} Tags for Assets:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
             
     except Exception as e:
         return [TextContent(
@@ -437,8 +427,6 @@ async def list_assets(
     """List assets via main endpoint (WITHOUT authentication)"""
     
     try:
-        import aiohttp
-        
         # Use main v1 endpoint according to documentation
         url = f"https://exposure.api.redbee.live/v1/customer/{config.customer}/businessunit/{config.business_unit}/content/asset"
         
@@ -495,33 +483,32 @@ async def list_assets(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    
-                    # Format the response
-                    result = f"Red Bee Media Assets List:\n"
-                    result += f"Page {data.get('pageNumber', 1)} of {data.get('pageSize', pageSize)} items\n"
-                    result += f"Total: {data.get('totalCount', 0)} assets\n\n"
-                    
-                    items = data.get('items', [])
-                    for i, item in enumerate(items[:pageSize], 1):
-                        result += f"{i}. **{item.get('localized', [{}])[0].get('title', 'Title not available')}**\n"
-                        result += f"   - ID: {item.get('assetId', 'N/A')}\n"
-                        result += f"   - Type: {item.get('type', 'N/A')}\n"
-                        if item.get('productionYear'):
-                            result += f"   - Year: {item.get('productionYear')}\n"
-                        if item.get('localized', [{}])[0].get('description'):
-                            desc = item.get('localized', [{}])[0].get('description', '')[:100]
-                            result += f"   - Description: {desc}...\n"
-                        result += "\n"
-                    
-                    return [TextContent(type="text", text=result)]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(type="text", text=f"Error retrieving assets: {response.status} - {error_text}")]
-                    
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            data = response.json()
+            
+            # Format the response
+            result = f"Red Bee Media Assets List:\n"
+            result += f"Page {data.get('pageNumber', 1)} of {data.get('pageSize', pageSize)} items\n"
+            result += f"Total: {data.get('totalCount', 0)} assets\n\n"
+            
+            items = data.get('items', [])
+            for i, item in enumerate(items[:pageSize], 1):
+                result += f"{i}. **{item.get('localized', [{}])[0].get('title', 'Title not available')}**\n"
+                result += f"   - ID: {item.get('assetId', 'N/A')}\n"
+                result += f"   - Type: {item.get('type', 'N/A')}\n"
+                if item.get('productionYear'):
+                    result += f"   - Year: {item.get('productionYear')}\n"
+                if item.get('localized', [{}])[0].get('description'):
+                    desc = item.get('localized', [{}])[0].get('description', '')[:100]
+                    result += f"   - Description: {desc}...\n"
+                result += "\n"
+            
+            return [TextContent(type="text", text=result)]
+        else:
+            error_text = response.text()
+            return [TextContent(type="text", text=f"Error retrieving assets: {response.status} - {error_text}")]
+            
     except Exception as e:
         return [TextContent(type="text", text=f"Error retrieving assets: {str(e)}")]
 
@@ -544,8 +531,6 @@ async def search_multi_v3(
     """Multi-search V3 for assets, tags, and participants"""
     
     try:
-        import aiohttp
-        
         # Use v3 multi search endpoint
         url = f"https://exposure.api.redbee.live/v3/customer/{config.customer}/businessunit/{config.business_unit}/content/search/query/{query}"
         
@@ -570,21 +555,20 @@ async def search_multi_v3(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Multi-Search V3 Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
-                    
+        response = await get_transport().get(url, params=params, headers=headers)
+        if response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Multi-Search V3 Results:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
+            
     except Exception as e:
         return [TextContent(
             type="text",
@@ -646,8 +630,6 @@ async def get_asset_thumbnail(
     """Get thumbnail for an asset at a specific time"""
     
     try:
-        import aiohttp
-        
         # Use v1 thumbnail endpoint (returns 307 redirect)
         url = f"https://exposure.api.redbee.live/v1/customer/{config.customer}/businessunit/{config.business_unit}/content/asset/{assetId}/thumbnail"
         
@@ -659,27 +641,26 @@ async def get_asset_thumbnail(
             "accept": "application/json;charset=UTF-8"
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, headers=headers, allow_redirects=False) as response:
-                if response.status == 307:
-                    thumbnail_url = response.headers.get("Location")
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Asset Thumbnail URL:\n{thumbnail_url}"
-                    )]
-                elif response.status == 200:
-                    result = await response.json()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee Media Asset Thumbnail Info:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                    )]
-                else:
-                    error_text = await response.text()
-                    return [TextContent(
-                        type="text",
-                        text=f"Red Bee API Error (Status {response.status}): {error_text}"
-                    )]
-                    
+        response = await get_transport().get(url, params=params, headers=headers, allow_redirects=False)
+        if response.status == 307:
+            thumbnail_url = response.headers.get("Location")
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Asset Thumbnail URL:\n{thumbnail_url}"
+            )]
+        elif response.status == 200:
+            result = response.json()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee Media Asset Thumbnail Info:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )]
+        else:
+            error_text = response.text()
+            return [TextContent(
+                type="text",
+                text=f"Red Bee API Error (Status {response.status}): {error_text}"
+            )]
+            
     except Exception as e:
         return [TextContent(
             type="text",
@@ -733,6 +714,94 @@ async def get_seasons_for_series(
         )]
 
 
+# Paginated listing tools and the v1 content endpoint behind each of them
+PAGINATED_TOOLS = {
+    "list_assets": "asset",
+    "get_asset_collection_entries": "asset/{assetId}/collectionentries",
+    "get_seasons_for_series": "asset/{assetId}/season",
+}
+
+
+def _listing_params(name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Builds the query parameters of a paginated listing tool call"""
+    params = {
+        "pageSize": arguments.get("pageSize", 50),
+        "onlyPublished": "true" if arguments.get("onlyPublished", True) else "false",
+        "fieldSet": arguments.get("fieldSet", "PARTIAL" if name == "list_assets" else "ALL")
+    }
+    if name == "list_assets":
+        for key in ("assetType", "assetTypes", "sort", "query", "parentalRatings", "publicationQuery"):
+            value = arguments.get(key)
+            if value:
+                params[key] = ",".join(value) if isinstance(value, list) else value
+    return params
+
+
+async def fetch_content_page(
+    config: RedBeeConfig,
+    path: str,
+    params: Dict[str, Any],
+    lane: Optional[str] = None
+) -> Dict[str, Any]:
+    """Fetches one raw page from a v1 content listing endpoint (WITHOUT authentication)"""
+    
+    url = f"{config.exposure_base_url}/v1/customer/{config.customer}/businessunit/{config.business_unit}/content/{path}"
+    
+    headers = {
+        "accept": "application/json;charset=UTF-8"
+    }
+    
+    response = await get_transport().get(url, params=params, headers=headers, lane=lane)
+    if response.status != 200:
+        error_text = response.text()
+        raise RedBeeAPIError(error_text, status_code=response.status)
+    return response.json()
+
+
+async def iter_listing_pages(
+    config: RedBeeConfig,
+    name: str,
+    arguments: Dict[str, Any],
+    max_pages: int = 10,
+    concurrency: int = 4
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Yields the raw pages of a paginated listing tool as they arrive
+    The first page gives totalCount; the remaining pages are then fetched
+    concurrently and yielded in completion order, tagged with pageNumber.
+    All pages are requested in the bulk upstream lane.
+    """
+    path = PAGINATED_TOOLS[name].format(**arguments)
+    params = _listing_params(name, arguments)
+    first_page_number = arguments.get("pageNumber", 1)
+    
+    first = await fetch_content_page(config, path, dict(params, pageNumber=first_page_number), lane=BULK)
+    first.setdefault("pageNumber", first_page_number)
+    yield first
+    
+    page_size = params["pageSize"] or 1
+    total_pages = -(-first.get("totalCount", 0) // page_size)
+    last_page_number = min(total_pages, first_page_number + max_pages - 1)
+    if last_page_number <= first_page_number:
+        return
+    
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch(page_number: int) -> Dict[str, Any]:
+        async with semaphore:
+            page = await fetch_content_page(config, path, dict(params, pageNumber=page_number), lane=BULK)
+            page.setdefault("pageNumber", page_number)
+            return page
+    
+    tasks = [asyncio.ensure_future(fetch(n)) for n in range(first_page_number + 1, last_page_number + 1)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
 # MCP Tool definitions
 CONTENT_TOOLS = [
     Tool(
@@ -8,10 +8,10 @@ import json
 from typing import List
 from mcp.types import TextContent, Tool
 
+from ..transport import get_transport
+
 async def get_system_config_impl(config, session_token=None):
     """Get system configuration via v2 endpoint"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v2/customer/{config.customer}/businessunit/{config.business_unit}/session/config"
         headers = {
@@ -20,16 +20,15 @@ async def get_system_config_impl(config, session_token=None):
         if session_token:
             headers["authorization"] = f"Bearer {session_token}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            result = response.json()
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Red Bee Media System Configuration:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                )
-            ]
+        response = await get_transport().get(url, headers=headers)
+        result = response.json()
+        
+        return [
+            TextContent(
+                type="text",
+                text=f"Red Bee Media System Configuration:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )
+        ]
     except Exception as e:
         return [
             TextContent(
@@ -40,24 +39,21 @@ async def get_system_config_impl(config, session_token=None):
 
 async def get_system_time_impl(config, session_token=None):
     """Get system time via v1 endpoint"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v1/time"
         headers = {
             "accept": "application/json"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            result = response.json()
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Red Bee Media System Time:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                )
-            ]
+        response = await get_transport().get(url, headers=headers)
+        result = response.json()
+        
+        return [
+            TextContent(
+                type="text",
+                text=f"Red Bee Media System Time:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )
+        ]
     except Exception as e:
         return [
             TextContent(
@@ -68,8 +64,6 @@ async def get_system_time_impl(config, session_token=None):
 
 async def get_user_location_impl(config, session_token=None):
     """Get user location information"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v1/customer/{config.customer}/businessunit/{config.business_unit}/geoip"
         headers = {
@@ -78,16 +72,15 @@ async def get_user_location_impl(config, session_token=None):
         if session_token:
             headers["authorization"] = f"Bearer {session_token}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            result = response.json()
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=f"User Location Information:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                )
-            ]
+        response = await get_transport().get(url, headers=headers)
+        result = response.json()
+        
+        return [
+            TextContent(
+                type="text",
+                text=f"User Location Information:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )
+        ]
     except Exception as e:
         return [
             TextContent(
@@ -98,8 +91,6 @@ async def get_user_location_impl(config, session_token=None):
 
 async def get_active_channels_impl(config, session_token=None):
     """Get active channels"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v1/customer/{config.customer}/businessunit/{config.business_unit}/content/asset"
         headers = {
@@ -113,16 +104,15 @@ async def get_active_channels_impl(config, session_token=None):
             "pageSize": 50
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers, params=params)
-            result = response.json()
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Active Channels:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                )
-            ]
+        response = await get_transport().get(url, headers=headers, params=params)
+        result = response.json()
+        
+        return [
+            TextContent(
+                type="text",
+                text=f"Active Channels:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )
+        ]
     except Exception as e:
         return [
             TextContent(
@@ -133,8 +123,6 @@ async def get_active_channels_impl(config, session_token=None):
 
 async def get_user_devices_impl(config, session_token=None):
     """Get user devices"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v1/customer/{config.customer}/businessunit/{config.business_unit}/user/device"
         headers = {
@@ -143,16 +131,15 @@ async def get_user_devices_impl(config, session_token=None):
         if session_token:
             headers["authorization"] = f"Bearer {session_token}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url, headers=headers)
-            result = response.json()
-            
-            return [
-                TextContent(
-                    type="text",
-                    text=f"User Devices:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
-                )
-            ]
+        response = await get_transport().get(url, headers=headers)
+        result = response.json()
+        
+        return [
+            TextContent(
+                type="text",
+                text=f"User Devices:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            )
+        ]
     except Exception as e:
         return [
             TextContent(
@@ -163,8 +150,6 @@ async def get_user_devices_impl(config, session_token=None):
 
 async def delete_user_device_impl(config, device_id, session_token=None):
     """Delete a user device"""
-    import httpx
-    
     try:
         url = f"{config.exposure_base_url}/v1/customer/{config.customer}/businessunit/{config.business_unit}/user/device/{device_id}"
         headers = {
@@ -173,24 +158,23 @@ async def delete_user_device_impl(config, device_id, session_token=None):
         if session_token:
             headers["authorization"] = f"Bearer {session_token}"
         
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(url, headers=headers)
-            
-            if response.status_code == 204:
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Device {device_id} successfully deleted"
-                    )
-                ]
-            else:
-                result = response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text
-                return [
-                    TextContent(
-                        type="text",
-                        text=f"Delete device response ({response.status_code}):\n{json.dumps(result, indent=2) if isinstance(result, dict) else result}"
-                    )
-                ]
+        response = await get_transport().request("DELETE", url, headers=headers)
+        
+        if response.status == 204:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Device {device_id} successfully deleted"
+                )
+            ]
+        else:
+            result = response.json() if response.headers.get("content-type", "").startswith("application/json") else response.text()
+            return [
+                TextContent(
+                    type="text",
+                    text=f"Delete device response ({response.status}):\n{json.dumps(result, indent=2) if isinstance(result, dict) else result}"
+                )
+            ]
     except Exception as e:
         return [
             TextContent(
@@ -0,0 +1,248 @@
+"""
+Shared upstream transport for Exposure API requests
+One connection pool per process, with priority lanes so interactive tools
+are not stuck behind bulk listings for upstream slots
+"""
+
+import asyncio
+import contextvars
+import json
+import logging
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional
+
+import aiohttp
+
+from .models import RedBeeConfig
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+DEFAULT = "default"
+BULK = "bulk"
+
+# Share of upstream slots granted to each lane when all of them are busy
+LANE_WEIGHTS = {INTERACTIVE: 8, DEFAULT: 4, BULK: 1}
+
+# Tools whose upstream requests go to a lane other than "default"
+TOOL_LANES = {
+    "search_assets_autocomplete": INTERACTIVE,
+    "get_system_time": INTERACTIVE,
+    "get_system_config": INTERACTIVE,
+    "get_user_location": INTERACTIVE,
+    "get_public_asset_details": INTERACTIVE,
+    "get_asset_thumbnail": INTERACTIVE,
+    "validate_session_token": INTERACTIVE,
+    "list_assets": BULK,
+    "get_asset_collection_entries": BULK,
+    "get_seasons_for_series": BULK,
+    "get_epg_for_channel": BULK,
+    "get_account_transactions": BULK,
+    "get_account_purchases": BULK,
+}
+
+_current_lane: "contextvars.ContextVar[str]" = contextvars.ContextVar("redbee_upstream_lane", default=DEFAULT)
+
+
+def lane_for_tool(name: str) -> str:
+    return TOOL_LANES.get(name, DEFAULT)
+
+
+@contextmanager
+def upstream_lane(lane: str) -> Iterator[None]:
+    """Runs the enclosed upstream requests in the given lane"""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class UpstreamResponse:
+    """Fully read upstream response"""
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+
+class LaneScheduler:
+    """
+    Weighted fair sharing of upstream slots between lanes
+
+    A free slot goes to the waiting lane with the lowest virtual time, and a
+    lane's virtual time advances by 1/weight per grant (stride scheduling).
+    Bulk work may use at most max_slots - interactive_reserve slots, so some
+    slots are always left for latency-sensitive calls.
+    """
+
+    def __init__(self, max_slots: int, interactive_reserve: int = 0, weights: Optional[Dict[str, int]] = None):
+        self.max_slots = max(1, max_slots)
+        self.bulk_limit = max(1, self.max_slots - max(0, interactive_reserve))
+        self.weights = dict(weights or LANE_WEIGHTS)
+        self.in_use = 0
+        self.in_use_by_lane: Dict[str, int] = {lane: 0 for lane in self.weights}
+        self._waiters: Dict[str, Deque["asyncio.Future[None]"]] = {lane: deque() for lane in self.weights}
+        self._virtual_time: Dict[str, float] = {lane: 0.0 for lane in self.weights}
+
+    def _lane_limit(self, lane: str) -> int:
+        return self.bulk_limit if lane == BULK else self.max_slots
+
+    def _can_grant(self, lane: str) -> bool:
+        return self.in_use < self.max_slots and self.in_use_by_lane[lane] < self._lane_limit(lane)
+
+    def _grant(self, lane: str) -> None:
+        self.in_use += 1
+        self.in_use_by_lane[lane] += 1
+        self._virtual_time[lane] += 1.0 / self.weights[lane]
+
+    async def acquire(self, lane: str) -> None:
+        if lane not in self.weights:
+            lane = DEFAULT
+        if self._can_grant(lane) and not any(self._waiters.values()):
+            self._grant(lane)
+            return
+
+        if not self._waiters[lane]:
+            # A lane returning from idle starts at the current virtual time
+            # instead of claiming the share it did not use
+            active = [self._virtual_time[l] for l, q in self._waiters.items() if q]
+            if active:
+                self._virtual_time[lane] = max(self._virtual_time[lane], min(active))
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[lane].append(waiter)
+        # Other lanes may be blocked by their own limit while this one can run
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted just before cancellation: hand it on
+                self.release(lane)
+            else:
+                self._waiters[lane].remove(waiter)
+            raise
+
+    def release(self, lane: str) -> None:
+        if lane not in self.weights:
+            lane = DEFAULT
+        self.in_use -= 1
+        self.in_use_by_lane[lane] -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self.in_use < self.max_slots:
+            candidates = [l for l, q in self._waiters.items() if q and self._can_grant(l)]
+            if not candidates:
+                return
+            lane = min(candidates, key=lambda l: self._virtual_time[l])
+            waiter = self._waiters[lane].popleft()
+            self._grant(lane)
+            waiter.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_use": self.in_use,
+            "max_slots": self.max_slots,
+            "lanes": {
+                lane: {"in_use": self.in_use_by_lane[lane], "waiting": len(self._waiters[lane])}
+                for lane in self.weights
+            },
+        }
+
+
+class UpstreamTransport:
+    """Pooled HTTP client shared by all tools of a process"""
+
+    def __init__(self, max_connections: int = 32, interactive_reserve: int = 4, timeout: float = 30.0):
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.scheduler = LaneScheduler(max_connections, interactive_reserve)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def from_config(cls, config: RedBeeConfig) -> "UpstreamTransport":
+        return cls(
+            max_connections=config.upstream_concurrency,
+            interactive_reserve=config.interactive_reserve,
+            timeout=config.timeout
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        json_data: Optional[Any] = None,
+        allow_redirects: bool = True,
+        lane: Optional[str] = None
+    ) -> UpstreamResponse:
+        """Sends one request once an upstream slot is free in its lane"""
+        lane = lane or _current_lane.get()
+        await self.scheduler.acquire(lane)
+        try:
+            session = self._get_session()
+            async with session.request(
+                method,
+                url,
+                params=params,
+                headers=headers,
+                json=json_data,
+                allow_redirects=allow_redirects
+            ) as response:
+                body = await response.read()
+                logger.debug(f"UPSTREAM [{lane}]: {method} {url} -> {response.status}")
+                return UpstreamResponse(response.status, response.headers.copy(), body)
+        finally:
+            self.scheduler.release(lane)
+
+    async def get(self, url: str, **kwargs: Any) -> UpstreamResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def stats(self) -> Dict[str, Any]:
+        return self.scheduler.stats()
+
+
+_transport: Optional[UpstreamTransport] = None
+
+
+def configure_transport(config: RedBeeConfig) -> UpstreamTransport:
+    """Creates the process-wide transport from the configuration"""
+    global _transport
+    _transport = UpstreamTransport.from_config(config)
+    return _transport
+
+
+def get_transport() -> UpstreamTransport:
+    """Returns the process-wide transport, creating a default one if needed"""
+    global _transport
+    if _transport is None:
+        _transport = UpstreamTransport()
+    return _transport